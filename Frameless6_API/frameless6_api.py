@@ -6,24 +6,43 @@ Based upon PySide6 in Python.
 v0.1.1
 """
 
-from PySide6.QtCore import Qt, Signal, QEventLoop, QPoint, QSize
+from PySide6.QtCore import Qt, Signal, QEventLoop, QPoint, QSize, QTimer
 from PySide6.QtGui import QCloseEvent, QKeyEvent, QPixmap, QIcon, QPainterPath, QRegion
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
     QLabel,
     QPushButton,
-    QHBoxLayout,
     QVBoxLayout,
     QApplication
 )
 
 from enum import IntEnum
+from time import monotonic
 import sys
 import ctypes
 
 
 RESIZE_MARGIN = 6
+MOVE_THROTTLE = 0.008   # seconds between edge checks (~120 Hz)
+
+# Resolve the taskbar grouping call once per process
+if sys.platform == "win32":
+    _SetAppID = ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID
+    _SetAppID.argtypes = [ctypes.c_wchar_p]
+    _SetAppID.restype = ctypes.HRESULT     # failure HRESULTs raise OSError
+else:
+    _SetAppID = None
+
+_current_app_id = None
+
+# Titlebar icon sources -> pixmap at the requested size
+_ICON_RESOLVERS = {
+    QPixmap: lambda p, sz: p,
+    QIcon: lambda p, sz: p.pixmap(sz),      # Extract a pixmap at the right size
+    str: lambda p, sz: QPixmap(p),
+    bytes: lambda p, sz: QPixmap(p),
+}
 
 
 class FramelessWindow(QMainWindow):
@@ -34,6 +53,32 @@ class FramelessWindow(QMainWindow):
 
     closeRequested = Signal()
 
+    # Plain int edge bits, cheaper to combine than Qt.Edges
+    _L = Qt.LeftEdge.value
+    _R = Qt.RightEdge.value
+    _T = Qt.TopEdge.value
+    _B = Qt.BottomEdge.value
+
+    # Resize cursor shape per edge combination
+    _CURSOR_MAP = {
+        _L: Qt.SizeHorCursor,
+        _R: Qt.SizeHorCursor,
+        _T: Qt.SizeVerCursor,
+        _B: Qt.SizeVerCursor,
+        _T | _L: Qt.SizeFDiagCursor,
+        _B | _R: Qt.SizeFDiagCursor,
+        _T | _R: Qt.SizeBDiagCursor,
+        _B | _L: Qt.SizeBDiagCursor,
+    }
+
+    _STYLE = """
+        #Root {
+            background-color: #1e1e1e;
+            border: 1px solid #525252;
+            border-radius: 14px;
+        }
+        """
+
     def __init__(
         self,
         app_name: str | None = None,
@@ -46,13 +91,14 @@ class FramelessWindow(QMainWindow):
         # App Identity
         self._app_name = app_name or "Application"
 
-        QApplication.instance().setApplicationName(self._app_name)
-        QApplication.instance().setApplicationDisplayName(self._app_name)
+        app = QApplication.instance()
+        app.setApplicationName(self._app_name)
+        app.setApplicationDisplayName(self._app_name)
         self.setWindowTitle(self._app_name)
 
         if app_icon:
             self.setWindowIcon(app_icon)
-            QApplication.instance().setWindowIcon(app_icon)
+            app.setWindowIcon(app_icon)
 
         # Group windows
         self._apply_windows_app_id()
@@ -65,26 +111,31 @@ class FramelessWindow(QMainWindow):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Window)
         self.setMouseTracking(True)
 
-        self._resize_edges = Qt.Edges()
+        self._resize_edges = 0      # int bitmask of Qt.Edge values
+        self._current_cursor_shape: Qt.CursorShape | None = None
+        self._last_move_ts = 0.0
+        self._last_pos = None      # (x, y, w, h) of the last handled move
+
+        # Trailing cursor update for moves dropped by the throttle
+        self._cursor_timer = QTimer(self)
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.setInterval(int(MOVE_THROTTLE * 1000))
+        self._cursor_timer.timeout.connect(self._apply_resize_cursor, Qt.DirectConnection)
         self._title_bar: QWidget | None = None
 
         # Root widget (draws border)
         self._root = QWidget(self)
         self._root.setObjectName("Root")
 
+        # Not WA_OpaquePaintEvent / WA_NoSystemBackground: the rounded
+        # corners leave pixels uncovered that must stay transparent
         self._root.setAttribute(Qt.WA_StyledBackground, True)
         self._root.setAttribute(Qt.WA_TranslucentBackground, False)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
 
         self.setCentralWidget(self._root)
 
-        self.setStyleSheet("""
-        #Root {
-            background-color: #1e1e1e;
-            border: 1px solid #525252;
-            border-radius: 14px;
-        }
-        """)
+        self.setStyleSheet(self._STYLE)
 
         # Layout inside root
         self._layout = QVBoxLayout(self._root)
@@ -92,7 +143,7 @@ class FramelessWindow(QMainWindow):
         self._layout.setSpacing(0)
 
         # Native-style close pipeline
-        self.closeRequested.connect(self.close)
+        self.closeRequested.connect(self.close, Qt.DirectConnection)
 
     # ---------------- PUBLIC API ---------------- #
 
@@ -130,42 +181,88 @@ class FramelessWindow(QMainWindow):
 
     def mouseMoveEvent(self, event):
         if self.isMaximized():
-            self.unsetCursor()
+            self._resize_edges = 0
+            self._set_resize_cursor(None)
+            self._last_pos = None
             return
 
-        pos = event.position().toPoint()
+        pos = event.position()
+        x = pos.x()
+        y = pos.y()
         rect = self.rect()
-        edges = Qt.Edges()
+        w = rect.width()
+        h = rect.height()
 
-        if pos.x() <= RESIZE_MARGIN:
-            edges |= Qt.LeftEdge
-        if pos.x() >= rect.width() - RESIZE_MARGIN:
-            edges |= Qt.RightEdge
-        if pos.y() <= RESIZE_MARGIN:
-            edges |= Qt.TopEdge
-        if pos.y() >= rect.height() - RESIZE_MARGIN:
-            edges |= Qt.BottomEdge
+        # Coalesce repeated events; the size is part of the key so a
+        # resize under a stationary pointer still refreshes the edges
+        key = (x, y, w, h)
+        if key == self._last_pos:
+            return
+        self._last_pos = key
 
-        self._resize_edges = edges
+        self._resize_edges = self._edges_at(x, y, w, h)
 
-        if edges in (Qt.LeftEdge, Qt.RightEdge):
-            self.setCursor(Qt.SizeHorCursor)
-        elif edges in (Qt.TopEdge, Qt.BottomEdge):
-            self.setCursor(Qt.SizeVerCursor)
-        elif edges in (Qt.TopEdge | Qt.LeftEdge, Qt.BottomEdge | Qt.RightEdge):
-            self.setCursor(Qt.SizeFDiagCursor)
-        elif edges in (Qt.TopEdge | Qt.RightEdge, Qt.BottomEdge | Qt.LeftEdge):
-            self.setCursor(Qt.SizeBDiagCursor)
-        else:
+        # Throttle cursor changes from high-rate pointer devices;
+        # edges above are always current
+        now = monotonic()
+        if now - self._last_move_ts < MOVE_THROTTLE:
+            if not self._cursor_timer.isActive():
+                self._cursor_timer.start()
+            return
+        self._last_move_ts = now
+
+        self._apply_resize_cursor()
+
+    def _edges_at(self, x, y, w, h) -> int:
+        """
+        Resize edge bitmask for a position inside a w x h window.
+        """
+        # Fast path: most moves happen away from the edges
+        if RESIZE_MARGIN < x < w - RESIZE_MARGIN and RESIZE_MARGIN < y < h - RESIZE_MARGIN:
+            return 0
+
+        edges = 0
+
+        if x <= RESIZE_MARGIN:
+            edges |= self._L
+        if x >= w - RESIZE_MARGIN:
+            edges |= self._R
+        if y <= RESIZE_MARGIN:
+            edges |= self._T
+        if y >= h - RESIZE_MARGIN:
+            edges |= self._B
+
+        return edges
+
+    def _apply_resize_cursor(self):
+        self._set_resize_cursor(FramelessWindow._CURSOR_MAP.get(self._resize_edges))
+
+    def _set_resize_cursor(self, shape):
+        """
+        Apply a resize cursor (None to unset), skipping no-op changes.
+        """
+        if shape == self._current_cursor_shape:
+            return
+        self._current_cursor_shape = shape
+
+        if shape is None:
             self.unsetCursor()
+        else:
+            self.setCursor(shape)
 
     def mousePressEvent(self, event):
+        # Recompute locally rather than read cached instance state
+        pos = event.position()
+        rect = self.rect()
+        edges = self._edges_at(pos.x(), pos.y(), rect.width(), rect.height())
+        self._resize_edges = edges
+
         if (
             event.button() == Qt.LeftButton
-            and self._resize_edges
+            and edges
             and not self.isMaximized()
         ):
-            self.windowHandle().startSystemResize(self._resize_edges)
+            self.windowHandle().startSystemResize(Qt.Edges(edges))
             event.accept()
             return
 
@@ -174,13 +271,15 @@ class FramelessWindow(QMainWindow):
     # ------------------- App Identity ------------------- #
 
     def setAppName(self, name: str):
+        if name == self._app_name:
+            return
+
         self._app_name = name
         self.setWindowTitle(name)
 
-        QApplication.instance().setApplicationName(name)
-        QApplication.instance().setApplicationDisplayName(name)
-
-        self.setWindowTitle(name)
+        app = QApplication.instance()
+        app.setApplicationName(name)
+        app.setApplicationDisplayName(name)
 
         # Keep custom titlebar in sync if present
         if self._title_bar and hasattr(self._title_bar, "setTitle"):
@@ -189,16 +288,23 @@ class FramelessWindow(QMainWindow):
     # ---------------- Window Grouping ID ---------------- #
 
     def _apply_windows_app_id(self):
-        if sys.platform != "win32":
+        global _current_app_id
+
+        if _SetAppID is None:
             return
         
         # stable, readable, deterministic
         safe_name = self._app_name.lower().replace(" ", "")
         app_id = f"com.projectironman.{safe_name}"    # ID must be stable + unique
 
+        # Already applied for this process
+        if _current_app_id == app_id:
+            return
+
         try:
-            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
-        except Exception as e:
+            _SetAppID(app_id)
+            _current_app_id = app_id
+        except OSError:
             # Fail silently - grouping is a best-effort feature
             pass
     
@@ -231,6 +337,25 @@ class TitleBar(QWidget):
 
     HEIGHT = 36
 
+    # Manual geometry (no layout): margins, spacing and button size
+    _MARGIN_LEFT = 10
+    _MARGIN_RIGHT = 6
+    _SPACING = 6
+    _BTN_W = 36
+    _BTN_H = 28
+
+    _STYLE = """
+        #Titlebar QPushButton#CloseButton:hover {
+            background: #c42b1c;
+            color: white;
+        }
+
+        #Titlebar QPushButton#CloseButton:pressed {
+            background: #a62216;
+            color: white;
+        }
+        """
+
     def __init__(
             self,
             window: FramelessWindow,
@@ -245,36 +370,26 @@ class TitleBar(QWidget):
         self.setAttribute(Qt.WA_StyledBackground, True)
         self.setFixedHeight(self.HEIGHT)
 
-        self.setStyleSheet("""
-
-        #Titlebar QPushButton#CloseButton:hover {
-            background: #c42b1c;
-            color: white;
-        }
-
-        #Titlebar QPushButton#CloseButton:pressed {
-            background: #a62216;
-            color: white;
-        }
-        """)
+        self.setStyleSheet(self._STYLE)
     
         # App Icon
-        icon_label = QLabel()
+        icon_label = QLabel(self)
         icon_label.setFixedSize(20,20)
         icon_label.setScaledContents(True)
         icon_label.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
 
         pixmap = None
 
-        if isinstance(icon_path, QPixmap):
-            pixmap = icon_path
-        
-        elif isinstance(icon_path, QIcon):
-            # Extract a pixmap from the QIcon at the right size
-            pixmap = icon_path.pixmap(icon_label.size())
-        
-        elif isinstance(icon_path, (str, bytes)):
-            pixmap = QPixmap(icon_path)
+        if icon_path is not None:
+            resolver = _ICON_RESOLVERS.get(type(icon_path))
+            if resolver is None:
+                # Subclasses (e.g. QBitmap) miss the exact-type lookup
+                resolver = next(
+                    (r for t, r in _ICON_RESOLVERS.items() if isinstance(icon_path, t)),
+                    None
+                )
+            if resolver is not None:
+                pixmap = resolver(icon_path, icon_label.size())
 
         if pixmap and not pixmap.isNull():
             pixmap = pixmap.scaled(
@@ -285,36 +400,62 @@ class TitleBar(QWidget):
             icon_label.setPixmap(pixmap)
         
         # Title text
-        self._title_label = QLabel(title)
+        self._title_label = QLabel(title, self)
         self._title_label.setObjectName("TitleLabel")
         self._title_label.setAlignment(Qt.AlignCenter | Qt.AlignLeft)
 
-        btn_min = QPushButton("–")
-        btn_max = QPushButton("□")
-        btn_close = QPushButton("✕")
+        btn_min = QPushButton("–", self)
+        btn_max = QPushButton("□", self)
+        btn_close = QPushButton("✕", self)
         btn_close.setObjectName("CloseButton")
 
         for btn in (btn_min, btn_max, btn_close):
-            btn.setFixedSize(36, 28)
+            btn.setFixedSize(self._BTN_W, self._BTN_H)
             btn.setFocusPolicy(Qt.NoFocus)
 
-        btn_min.clicked.connect(window.showMinimized)
-        btn_max.clicked.connect(self.toggle_maximize)
-        btn_close.clicked.connect(self.request_close)
+        btn_min.clicked.connect(window.showMinimized, Qt.DirectConnection)
+        btn_max.clicked.connect(self.toggle_maximize, Qt.DirectConnection)
+        btn_close.clicked.connect(self.request_close, Qt.DirectConnection)
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 0, 6, 0)
-        layout.setSpacing(6)
+        # Positioned in resizeEvent
+        self._icon_label = icon_label
+        self._buttons = (btn_min, btn_max, btn_close)
 
-        layout.addWidget(icon_label)
-        layout.addWidget(self._title_label)
-        layout.addStretch()
-        layout.addWidget(btn_min)
-        layout.addWidget(btn_max)
-        layout.addWidget(btn_close)
+        # No layout to supply a minimum; keep icon and buttons from overlapping
+        self.setMinimumWidth(
+            self._MARGIN_LEFT + icon_label.width()
+            + 3 * self._BTN_W + 3 * self._SPACING
+            + self._MARGIN_RIGHT
+        )
 
         window.setTitleBar(self)
 
+    # ---------------- GEOMETRY ---------------- #
+
+    def resizeEvent(self, event):
+        """
+        Place children directly; the bar has a fixed height and only
+        the title width depends on the window width.
+        """
+        super().resizeEvent(event)
+
+        w = self.width()
+        h = self.height()
+        icon = self._icon_label
+
+        icon.move(self._MARGIN_LEFT, (h - icon.height()) // 2)
+
+        # Buttons right-to-left
+        x = w - self._MARGIN_RIGHT
+        btn_y = (h - self._BTN_H) // 2
+        for btn in reversed(self._buttons):
+            x -= self._BTN_W
+            btn.move(x, btn_y)
+            x -= self._SPACING
+
+        title_x = self._MARGIN_LEFT + icon.width() + self._SPACING
+        self._title_label.setGeometry(title_x, 0, max(0, x - title_x), h)
+
     # ---------------- TITLEBAR BEHAVIOR ---------------- #
 
     def request_close(self):
@@ -367,7 +508,8 @@ class FramelessDialog(FramelessWindow):
         super().__init__(app_name=app_name, app_icon=app_icon)
 
         # Dialog State
-        self._event_loop: QEventLoop | None = None
+        self._event_loop = QEventLoop(self)
+        self.finished.connect(self._event_loop.quit, Qt.DirectConnection)
         self._result = DialogCode.REJECTED
         self._parent = parent
         self._previous_focus = None
@@ -398,7 +540,7 @@ class FramelessDialog(FramelessWindow):
     # ---------------- EXEC / MODALITY ---------------- #
 
     def exec(self) -> int:
-        if self._event_loop is not None:
+        if self._event_loop.isRunning():
             return self._result  # already running
 
         if self._parent:
@@ -406,9 +548,6 @@ class FramelessDialog(FramelessWindow):
 
         self._previous_focus = QApplication.focusWidget()
 
-        self._event_loop = QEventLoop(self)
-        self.finished.connect(self._event_loop.quit)
-
         self._center_on_parent()
         self.show()
         self.raise_()
@@ -423,7 +562,6 @@ class FramelessDialog(FramelessWindow):
         if self._previous_focus:
             self._previous_focus.setFocus(Qt.OtherFocusReason)
 
-        self._event_loop = None
         return self._result
 
     # ---------------- DIALOG CONTROL ---------------- #